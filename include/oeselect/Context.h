@@ -11,7 +11,6 @@
 
 #include <memory>
 #include <string>
-#include <unordered_set>
 #include <vector>
 
 namespace OEChem {
@@ -78,18 +77,18 @@ public:
     /// @{
 
     /**
-     * @brief Get cached atom indices for a residue-based selection.
+     * @brief Get cached atom mask for a residue-based selection.
      * @param key Cache key (typically predicate canonical form).
-     * @return Set of atom indices in matching residues.
+     * @return Boolean mask indexed by atom index.
      */
-    const std::unordered_set<unsigned int>& GetResidueAtoms(const std::string& key);
+    const std::vector<bool>& GetResidueMask(const std::string& key);
 
     /**
-     * @brief Store atom indices for a residue-based selection.
+     * @brief Store atom mask for a residue-based selection.
      * @param key Cache key.
-     * @param atoms Set of atom indices.
+     * @param mask Boolean mask indexed by atom index.
      */
-    void SetResidueAtoms(const std::string& key, std::unordered_set<unsigned int> atoms);
+    void SetResidueMask(const std::string& key, std::vector<bool> mask);
 
     /**
      * @brief Check if residue cache contains a key.
@@ -105,18 +104,18 @@ public:
     /// @{
 
     /**
-     * @brief Get cached atom indices for a chain-based selection.
+     * @brief Get cached atom mask for a chain-based selection.
      * @param key Cache key.
-     * @return Set of atom indices in matching chains.
+     * @return Boolean mask indexed by atom index.
      */
-    const std::unordered_set<unsigned int>& GetChainAtoms(const std::string& key);
+    const std::vector<bool>& GetChainMask(const std::string& key);
 
     /**
-     * @brief Store atom indices for a chain-based selection.
+     * @brief Store atom mask for a chain-based selection.
      * @param key Cache key.
-     * @param atoms Set of atom indices.
+     * @param mask Boolean mask indexed by atom index.
      */
-    void SetChainAtoms(const std::string& key, std::unordered_set<unsigned int> atoms);
+    void SetChainMask(const std::string& key, std::vector<bool> mask);
 
     /**
      * @brief Check if chain cache contains a key.
@@ -0,0 +1,40 @@
+/**
+ * @file Optimizer.h
+ * @brief Predicate-tree optimization applied after parsing.
+ *
+ * The parser produces a faithful tree for the input expression; this module
+ * rewrites that tree into an equivalent form that evaluates faster. The
+ * rewritten tree is observably identical: ToCanonical() sorts children
+ * independently of evaluation order, and all predicates are side-effect-free
+ * apart from idempotent context caching.
+ */
+
+#ifndef OESELECT_OPTIMIZER_H
+#define OESELECT_OPTIMIZER_H
+
+#include "oeselect/Predicate.h"
+
+namespace OESel {
+
+/**
+ * @brief Optimize a parsed predicate tree for evaluation.
+ *
+ * Reorders the children of AND/OR nodes by a static cost estimate so that
+ * cheap atom-property checks run before expensive distance or expansion
+ * subtrees. Combined with the existing short-circuit evaluation in
+ * AndPredicate/OrPredicate, most atoms never reach the expensive work:
+ * in `ligand around 5 and name CA`, the name check rejects atoms before
+ * the spatial query is consulted. Constants fold away: `all`/`none`
+ * children collapse their AND/OR parents where they dominate and are
+ * dropped where they are the identity, negated constants invert, and
+ * double negation (`not not x`) is eliminated, so selections like
+ * `x and none` never touch the molecule.
+ *
+ * @param pred Root of the parsed predicate tree.
+ * @return Optimized predicate tree (may share subtrees with the input).
+ */
+Predicate::Ptr optimize_predicate(const Predicate::Ptr& pred);
+
+}  // namespace OESel
+
+#endif  // OESELECT_OPTIMIZER_H
@@ -83,6 +83,21 @@ enum class PredicateType {
     NO_MATCH    ///< Never matches (used for 'none' keyword)
 };
 
+/**
+ * @brief Shape of a name/residue-name glob pattern, classified at parse time.
+ *
+ * Name-matching predicates classify their pattern once at construction so
+ * the per-atom test is a plain equality or anchored comparison in the common
+ * cases ("CA", "H*", "*G"), falling back to full wildcard matching only for
+ * general patterns.
+ */
+enum class GlobMatchKind {
+    EXACT,   ///< No wildcards; single string equality
+    PREFIX,  ///< Single trailing `*` (e.g. "CA*"); prefix comparison
+    SUFFIX,  ///< Single leading `*` (e.g. "*G"); suffix comparison
+    GLOB     ///< General pattern; full wildcard matching
+};
+
 /**
  * @brief Abstract base class for all selection predicates.
  *
@@ -10,6 +10,7 @@
 #ifndef OESELECT_RESIDUESELECTOR_H
 #define OESELECT_RESIDUESELECTOR_H
 
+#include <cstddef>
 #include <set>
 #include <string>
 
@@ -76,6 +77,17 @@ struct Selector {
      */
     [[nodiscard]] std::string ToString() const;
 
+    /**
+     * @brief Hash over (name, residue_number, chain, insert_code).
+     *
+     * Consistent with operator==: equal selectors hash equally. Computed
+     * on demand rather than cached because the fields are publicly
+     * mutable.
+     *
+     * @return 64-bit FNV-1a hash of the identifying fields.
+     */
+    [[nodiscard]] std::size_t Hash() const;
+
     /// @brief Comparison by (chain, residue_number, insert_code, name).
     bool operator<(const Selector& other) const;
     bool operator>(const Selector& other) const;
@@ -76,7 +76,8 @@ public:
      * @brief Get canonical string representation.
      *
      * Returns a normalized form of the selection suitable for comparison
-     * and display. AND/OR children are sorted alphabetically.
+     * and display. AND/OR children are sorted alphabetically. The canonical
+     * form is computed once at construction, so this call is cheap.
      *
      * @return Canonical selection string.
      */
@@ -86,7 +87,9 @@ public:
      * @brief Check if selection contains a predicate of given type.
      *
      * Useful for determining what resources may be needed for evaluation.
-     * For example, distance predicates require a spatial index.
+     * For example, distance predicates require a spatial index. The set of
+     * present types is precomputed at construction, so this is a single
+     * bit test rather than a tree walk.
      *
      * @param type The predicate type to search for.
      * @return true if the selection tree contains this predicate type.
@@ -78,6 +78,20 @@ public:
      */
     [[nodiscard]] std::vector<unsigned int> FindWithinRadius(const OEChem::OEAtomBase& atom, float radius) const;
 
+    /**
+     * @brief Mark all atoms within radius of another atom in a mask.
+     *
+     * Sets mask[idx] for every atom within the radius, without building an
+     * intermediate index vector. Used by distance predicates that union
+     * results from many reference atoms into one per-molecule mask.
+     *
+     * @param atom Reference atom for the query.
+     * @param radius Maximum distance in Angstroms.
+     * @param mask Boolean mask indexed by atom index; matching bits are set.
+     */
+    void MarkWithinRadius(const OEChem::OEAtomBase& atom, float radius,
+                          std::vector<bool>& mask) const;
+
     /**
      * @brief Get the number of atoms in the index.
      * @return Number of indexed atoms.
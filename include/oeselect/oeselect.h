@@ -47,6 +47,7 @@ class Tagger;
 #include "oeselect/Selector.h"
 #include "oeselect/Context.h"
 #include "oeselect/Parser.h"
+#include "oeselect/Optimizer.h"
 #include "oeselect/Tagger.h"
 #include "oeselect/ResidueSelector.h"
 #include "oeselect/CustomPredicates.h"
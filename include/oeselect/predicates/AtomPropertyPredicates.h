@@ -38,7 +38,8 @@ public:
 
 private:
     std::string pattern_;
-    bool has_wildcard_;
+    std::string literal_;
+    GlobMatchKind match_kind_;
 };
 
 /**
@@ -104,6 +105,7 @@ public:
 
 private:
     std::string chain_id_;
+    char chain_char_;  ///< Single-character form, or '\0' if chain_id_ is not one char
 };
 
 /**
@@ -239,6 +241,7 @@ public:
 
 private:
     std::string alt_id_;
+    char alt_char_;  ///< Single-character form, or '\0' if alt_id_ is not one char
 };
 
 /**
@@ -10,7 +10,7 @@
 #define OESELECT_PREDICATES_EXPANSION_PREDICATES_H
 
 #include "oeselect/Predicate.h"
-#include <unordered_set>
+#include <vector>
 
 namespace OESel {
 
@@ -42,8 +42,8 @@ public:
 private:
     Ptr child_;
 
-    /// Get cached set of atom indices in matching residues
-    const std::unordered_set<unsigned int>& GetMatchingResidues(Context& ctx) const;
+    /// Get cached per-atom mask of atoms in matching residues
+    const std::vector<bool>& GetMatchingResidues(Context& ctx) const;
 };
 
 /**
@@ -74,8 +74,8 @@ public:
 private:
     Ptr child_;
 
-    /// Get cached set of atom indices in matching chains
-    const std::unordered_set<unsigned int>& GetMatchingChainAtoms(Context& ctx) const;
+    /// Get cached per-atom mask of atoms in matching chains
+    const std::vector<bool>& GetMatchingChainAtoms(Context& ctx) const;
 };
 
 }  // namespace OESel
@@ -42,8 +42,9 @@ public:
     [[nodiscard]] PredicateType Type() const override { return PredicateType::NAME; }
 
 private:
-    std::string pattern_;    ///< Name pattern (may contain wildcards)
-    bool has_wildcard_;      ///< True if pattern contains * or ?
+    std::string pattern_;       ///< Name pattern (may contain wildcards)
+    std::string literal_;       ///< Literal part for EXACT/PREFIX/SUFFIX kinds
+    GlobMatchKind match_kind_;  ///< Pattern shape, classified at construction
 };
 
 }  // namespace OESel
@@ -93,6 +93,8 @@ Hierarchical macro syntax:
     - //chain/resi/name: e.g., //A/100/CA
 """
 
+import enum
+import functools
 import hashlib
 import importlib.machinery
 import importlib.util
@@ -120,6 +122,7 @@ def _user_cache_root():
     return Path.home() / ".cache" / "oeselect"
 
 
+@functools.lru_cache(maxsize=1)
 def _runtime_openeye_version():
     """Return the installed OpenEye toolkit distribution version if available."""
     try:
@@ -329,6 +332,7 @@ def _ensure_library_compat():
     return needs_cached_origin
 
 
+@functools.lru_cache(maxsize=1)
 def _extension_suffixes():
     """Return extension-module suffixes for the active Python interpreter."""
     return tuple(importlib.machinery.EXTENSION_SUFFIXES)
@@ -510,20 +514,35 @@ def _preload_bundled_libs():
             remaining = failed
 
 
+@functools.lru_cache(maxsize=1)
 def _check_openeye_version():
-    """Check that the OpenEye version matches what was used at build time."""
+    """Check that the OpenEye version matches what was used at build time.
+
+    The result is cached so repeated imports in the same process (e.g. via
+    ``importlib.reload`` or Sphinx autodoc sessions) skip the distribution
+    metadata lookup after the first check. Set OESELECT_SKIP_VERSION_CHECK
+    to bypass the check entirely.
+    """
+    if os.environ.get("OESELECT_SKIP_VERSION_CHECK"):
+        return
+
     try:
         from . import _build_info
     except ImportError:
         # Build info not available (development install)
         return
 
-    # Only check if using shared/dynamic linking
-    if getattr(_build_info, 'OPENEYE_LIBRARY_TYPE', 'STATIC') != 'SHARED':
+    # _build_info is generated at wheel build time with known contents, so
+    # direct attribute access with AttributeError as the sentinel beats
+    # getattr-with-default probing on the common path.
+    try:
+        lib_type = _build_info.OPENEYE_LIBRARY_TYPE
+        build_version = _build_info.OPENEYE_BUILD_VERSION
+    except AttributeError:
         return
 
-    build_version = getattr(_build_info, 'OPENEYE_BUILD_VERSION', None)
-    if not build_version:
+    # Only check if using shared/dynamic linking
+    if lib_type != 'SHARED' or not build_version:
         return
 
     runtime_version = _runtime_openeye_version()
@@ -561,31 +580,67 @@ _preload_bundled_libs()
 # Load the extension from the alias cache when $ORIGIN must see cached aliases
 _load_cached_extension_if_needed()
 
-# Check OpenEye version on import
-_check_openeye_version()
-
-from .oeselect import (
-    OESelection,
-    OESelect as _CppOESelect,
-    Selector,
-    OEResidueSelector as _CppOEResidueSelector,
-    OEHasResidueName as _CppOEHasResidueName,
-    OEHasAtomNameAdvanced as _CppOEHasAtomNameAdvanced,
-    EvaluateSelection,
-    CountSelection,
-    parse_selector_set,
-    mol_to_selector_set,
-    str_selector_set,
-    get_selector_string,
-    select,
-    count,
-    parse,
-    selector_set as _cpp_selector_set,
-)
+# The SWIG extension module is imported lazily (PEP 562). Importing
+# ``.oeselect`` loads the C++ shared library, which dominates cold-start
+# import time; deferring it means users who only touch pure-Python helpers
+# (or just read ``__version__``) never pay for it.
+_cpp_module = None
+
+
+def _cpp():
+    """Import the SWIG extension module on first use and cache it.
+
+    The OpenEye version check runs here, on first real use, instead of at
+    package import: worker processes that import oeselect but never evaluate
+    a selection skip the distribution metadata lookup entirely.
+    """
+    global _cpp_module
+    if _cpp_module is None:
+        from . import oeselect as _cpp_module  # noqa: F401
+        _check_openeye_version()
+    return _cpp_module
+
+
+# Public names re-exported from the SWIG module, resolved on first access
+# by the module-level __getattr__ below.
+_CPP_EXPORTS = frozenset({
+    "OESelection",
+    "Selector",
+    "EvaluateSelection",
+    "CountSelection",
+    "parse_selector_set",
+    "mol_to_selector_set",
+    "str_selector_set",
+    "get_selector_string",
+    "select",
+    "count",
+    "parse",
+})
+
+
+def __getattr__(name):
+    if name in _CPP_EXPORTS or name.startswith("PredicateType_"):
+        value = getattr(_cpp(), name)
+    elif name == "PredicateType":
+        value = _make_predicate_type()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the resolved name so subsequent lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
+
+@functools.lru_cache(maxsize=1)
 def _get_openeye_atom_predicate_base():
-    """Load the OpenEye atom predicate base only when a predicate is instantiated."""
+    """Load the OpenEye atom predicate base only when a predicate is instantiated.
+
+    Cached because every predicate __init__ calls this; after the first
+    resolution the import machinery and attribute lookup are skipped.
+    """
     from openeye import oechem
 
     return oechem.OEUnaryAtomPred
@@ -598,7 +653,9 @@ def _get_lazy_openeye_predicate_type(public_cls):
         predicate_cls = type(
             public_cls.__name__,
             (public_cls, _get_openeye_atom_predicate_base()),
-            {"__module__": public_cls.__module__},
+            # Empty __slots__ so the subclass adds no per-instance __dict__
+            # beyond what the OpenEye base itself requires.
+            {"__module__": public_cls.__module__, "__slots__": ()},
         )
         public_cls._openeye_predicate_type = predicate_cls
     return predicate_cls
@@ -631,6 +688,8 @@ class OESelect:
         num = oechem.OECount(mol, pred)
     """
 
+    __slots__ = ("_mol", "_cpp_select")
+
     _openeye_predicate_type = None
 
     def __new__(cls, *args, **kwargs):
@@ -642,14 +701,17 @@ class OESelect:
     def __init__(self, mol, sele=None):
         _get_openeye_atom_predicate_base().__init__(self)
         self._mol = mol
+        # String selections go through the module's memoized parse(), so
+        # repeated strings reuse the cached OESelection.
+        ext = _cpp()
         if sele is None:
-            self._cpp_select = _CppOESelect(mol, "all")
+            self._cpp_select = ext.OESelect(mol, ext.parse("all"))
         elif isinstance(sele, str):
-            self._cpp_select = _CppOESelect(mol, sele)
-        elif isinstance(sele, OESelection):
-            self._cpp_select = _CppOESelect(mol, sele)
+            self._cpp_select = ext.OESelect(mol, ext.parse(sele))
+        elif isinstance(sele, ext.OESelection):
+            self._cpp_select = ext.OESelect(mol, sele)
         else:
-            self._cpp_select = _CppOESelect(mol, str(sele))
+            self._cpp_select = ext.OESelect(mol, ext.parse(str(sele)))
 
     def __call__(self, atom):
         """Test if an atom matches the selection.
@@ -659,16 +721,48 @@ class OESelect:
         """
         return self._cpp_select(atom)
 
+    def evaluate_all(self):
+        """Evaluate the selection against every atom in a single C++ pass.
+
+        Unlike iterating with ``mol.GetAtoms(pred)``, which crosses the
+        Python/C++ boundary once per atom, this calls the bulk C++ evaluator
+        once for the whole molecule.
+
+        :returns: List of matching atom indices.
+        """
+        return list(_cpp().EvaluateSelection(
+            self._mol, self._cpp_select.GetSelection()))
+
     def __iter__(self):
         """Iterate over atoms matching the selection.
 
+        Uses the bulk :meth:`evaluate_all` path and then resolves only the
+        matching atoms, avoiding a Python ``__call__`` dispatch per atom.
+
         :returns: Iterator of matching OEAtomBase objects.
         """
-        return iter(self._mol.GetAtoms(self))
+        # Materialize the atoms once and resolve indices by lookup; a
+        # GetAtom(OEHasAtomIdx(idx)) call per index would scan the molecule
+        # for every match. Keyed by GetIdx rather than list position so
+        # non-contiguous indices (after atom deletions) resolve correctly.
+        atoms = {atom.GetIdx(): atom for atom in self._mol.GetAtoms()}
+        for idx in self.evaluate_all():
+            atom = atoms.get(idx)
+            if atom is not None:
+                yield atom
 
     def CreateCopy(self):
-        """Create a copy for OpenEye compatibility."""
-        copy = OESelect(self._mol, self._cpp_select.GetSelection())
+        """Create a copy for OpenEye compatibility.
+
+        Uses the C++ copy constructor so the parsed selection and evaluator
+        state are shared instead of being rebuilt against the molecule;
+        OpenEye's predicate combinators (OEAndAtom, OEOrAtom) call
+        CreateCopy repeatedly, so this compounds.
+        """
+        copy = OESelect.__new__(OESelect)
+        _get_openeye_atom_predicate_base().__init__(copy)
+        copy._mol = self._mol
+        copy._cpp_select = _cpp().OESelect(self._cpp_select)
         return copy.__disown__()
 
     @property
@@ -690,8 +784,8 @@ def selector_set(*args):
     :returns: Set of Selector objects in selector order.
     """
     if len(args) == 1 and isinstance(args[0], OESelect):
-        return _cpp_selector_set(args[0]._cpp_select)
-    return _cpp_selector_set(*args)
+        return _cpp().selector_set(args[0]._cpp_select)
+    return _cpp().selector_set(*args)
 
 
 class OEResidueSelector:
@@ -710,6 +804,8 @@ class OEResidueSelector:
             print(atom.GetName())
     """
 
+    __slots__ = ("_cpp_selector",)
+
     _openeye_predicate_type = None
 
     def __new__(cls, *args, **kwargs):
@@ -721,9 +817,9 @@ class OEResidueSelector:
     def __init__(self, selector_str):
         _get_openeye_atom_predicate_base().__init__(self)
         if isinstance(selector_str, str):
-            self._cpp_selector = _CppOEResidueSelector(selector_str)
+            self._cpp_selector = _cpp().OEResidueSelector(selector_str)
         else:
-            self._cpp_selector = _CppOEResidueSelector(selector_str)
+            self._cpp_selector = _cpp().OEResidueSelector(selector_str)
 
     def __call__(self, atom):
         """Test if an atom belongs to one of the specified residues.
@@ -737,7 +833,7 @@ class OEResidueSelector:
         """Create a copy for OpenEye compatibility."""
         copy = OEResidueSelector.__new__(OEResidueSelector)
         _get_openeye_atom_predicate_base().__init__(copy)
-        copy._cpp_selector = _CppOEResidueSelector(self._cpp_selector)
+        copy._cpp_selector = _cpp().OEResidueSelector(self._cpp_selector)
         return copy.__disown__()
 
 
@@ -753,6 +849,8 @@ class OEHasResidueName:
         pred = OEHasResidueName("ala")  # Matches "ALA", " ALA", etc.
     """
 
+    __slots__ = ("_cpp_pred", "_residue_name", "_case_sensitive", "_whitespace")
+
     _openeye_predicate_type = None
 
     def __new__(cls, *args, **kwargs):
@@ -764,7 +862,7 @@ class OEHasResidueName:
     def __init__(self, residue_name: str, case_sensitive: bool = False,
                  whitespace: bool = False):
         _get_openeye_atom_predicate_base().__init__(self)
-        self._cpp_pred = _CppOEHasResidueName(residue_name, case_sensitive, whitespace)
+        self._cpp_pred = _cpp().OEHasResidueName(residue_name, case_sensitive, whitespace)
         self._residue_name = residue_name
         self._case_sensitive = case_sensitive
         self._whitespace = whitespace
@@ -789,6 +887,8 @@ class OEHasAtomNameAdvanced:
         pred = OEHasAtomNameAdvanced("ca")  # Matches "CA", " CA", etc.
     """
 
+    __slots__ = ("_cpp_pred", "_atom_name", "_case_sensitive", "_whitespace")
+
     _openeye_predicate_type = None
 
     def __new__(cls, *args, **kwargs):
@@ -800,7 +900,7 @@ class OEHasAtomNameAdvanced:
     def __init__(self, atom_name: str, case_sensitive: bool = False,
                  whitespace: bool = False):
         _get_openeye_atom_predicate_base().__init__(self)
-        self._cpp_pred = _CppOEHasAtomNameAdvanced(atom_name, case_sensitive, whitespace)
+        self._cpp_pred = _cpp().OEHasAtomNameAdvanced(atom_name, case_sensitive, whitespace)
         self._atom_name = atom_name
         self._case_sensitive = case_sensitive
         self._whitespace = whitespace
@@ -812,87 +912,67 @@ class OEHasAtomNameAdvanced:
         copy = OEHasAtomNameAdvanced(self._atom_name, self._case_sensitive, self._whitespace)
         return copy.__disown__()
 
-# Import PredicateType enum values
-from .oeselect import (
-    PredicateType_AND,
-    PredicateType_OR,
-    PredicateType_NOT,
-    PredicateType_XOR,
-    PredicateType_NAME,
-    PredicateType_RESN,
-    PredicateType_RESI,
-    PredicateType_CHAIN,
-    PredicateType_ELEM,
-    PredicateType_INDEX,
-    PredicateType_ID,
-    PredicateType_ALT,
-    PredicateType_B_FACTOR,
-    PredicateType_FRAGMENT,
-    PredicateType_SECONDARY_STRUCTURE,
-    PredicateType_PROTEIN,
-    PredicateType_LIGAND,
-    PredicateType_WATER,
-    PredicateType_SOLVENT,
-    PredicateType_ORGANIC,
-    PredicateType_BACKBONE,
-    PredicateType_METAL,
-    PredicateType_HEAVY,
-    PredicateType_HYDROGEN,
-    PredicateType_POLAR_HYDROGEN,
-    PredicateType_NONPOLAR_HYDROGEN,
-    PredicateType_BY_RES,
-    PredicateType_BY_CHAIN,
-    PredicateType_AROUND,
-    PredicateType_EXPAND,
-    PredicateType_BEYOND,
-    PredicateType_HELIX,
-    PredicateType_SHEET,
-    PredicateType_TURN,
-    PredicateType_LOOP,
-    PredicateType_ALL_MATCH,
-    PredicateType_NO_MATCH,
-)
-
-# Create a namespace for PredicateType enum
-class PredicateType:
-    """Enum-like class for predicate types."""
-    And = PredicateType_AND
-    Or = PredicateType_OR
-    Not = PredicateType_NOT
-    XOr = PredicateType_XOR
-    Name = PredicateType_NAME
-    Resn = PredicateType_RESN
-    Resi = PredicateType_RESI
-    Chain = PredicateType_CHAIN
-    Elem = PredicateType_ELEM
-    Index = PredicateType_INDEX
-    Id = PredicateType_ID
-    Alt = PredicateType_ALT
-    BFactor = PredicateType_B_FACTOR
-    Fragment = PredicateType_FRAGMENT
-    SecondaryStructure = PredicateType_SECONDARY_STRUCTURE
-    Protein = PredicateType_PROTEIN
-    Ligand = PredicateType_LIGAND
-    Water = PredicateType_WATER
-    Solvent = PredicateType_SOLVENT
-    Organic = PredicateType_ORGANIC
-    Backbone = PredicateType_BACKBONE
-    Metal = PredicateType_METAL
-    Heavy = PredicateType_HEAVY
-    Hydrogen = PredicateType_HYDROGEN
-    PolarHydrogen = PredicateType_POLAR_HYDROGEN
-    NonpolarHydrogen = PredicateType_NONPOLAR_HYDROGEN
-    ByRes = PredicateType_BY_RES
-    ByChain = PredicateType_BY_CHAIN
-    Around = PredicateType_AROUND
-    Expand = PredicateType_EXPAND
-    Beyond = PredicateType_BEYOND
-    Helix = PredicateType_HELIX
-    Sheet = PredicateType_SHEET
-    Turn = PredicateType_TURN
-    Loop = PredicateType_LOOP
-    True_ = PredicateType_ALL_MATCH
-    False_ = PredicateType_NO_MATCH
+# Mapping from PredicateType attribute names to SWIG module constants.
+# The PredicateType namespace class is built lazily by __getattr__ so that
+# accessing it (or any PredicateType_* constant) triggers the extension load
+# only when actually needed.
+_PREDICATE_TYPE_MEMBERS = {
+    "And": "PredicateType_AND",
+    "Or": "PredicateType_OR",
+    "Not": "PredicateType_NOT",
+    "XOr": "PredicateType_XOR",
+    "Name": "PredicateType_NAME",
+    "Resn": "PredicateType_RESN",
+    "Resi": "PredicateType_RESI",
+    "Chain": "PredicateType_CHAIN",
+    "Elem": "PredicateType_ELEM",
+    "Index": "PredicateType_INDEX",
+    "Id": "PredicateType_ID",
+    "Alt": "PredicateType_ALT",
+    "BFactor": "PredicateType_B_FACTOR",
+    "Fragment": "PredicateType_FRAGMENT",
+    "SecondaryStructure": "PredicateType_SECONDARY_STRUCTURE",
+    "Protein": "PredicateType_PROTEIN",
+    "Ligand": "PredicateType_LIGAND",
+    "Water": "PredicateType_WATER",
+    "Solvent": "PredicateType_SOLVENT",
+    "Organic": "PredicateType_ORGANIC",
+    "Backbone": "PredicateType_BACKBONE",
+    "Metal": "PredicateType_METAL",
+    "Heavy": "PredicateType_HEAVY",
+    "Hydrogen": "PredicateType_HYDROGEN",
+    "PolarHydrogen": "PredicateType_POLAR_HYDROGEN",
+    "NonpolarHydrogen": "PredicateType_NONPOLAR_HYDROGEN",
+    "ByRes": "PredicateType_BY_RES",
+    "ByChain": "PredicateType_BY_CHAIN",
+    "Around": "PredicateType_AROUND",
+    "Expand": "PredicateType_EXPAND",
+    "Beyond": "PredicateType_BEYOND",
+    "Helix": "PredicateType_HELIX",
+    "Sheet": "PredicateType_SHEET",
+    "Turn": "PredicateType_TURN",
+    "Loop": "PredicateType_LOOP",
+    "True_": "PredicateType_ALL_MATCH",
+    "False_": "PredicateType_NO_MATCH",
+}
+
+
+def _make_predicate_type():
+    """Build the PredicateType enum from the SWIG constants.
+
+    An IntEnum keeps backwards compatibility with the plain integer
+    PredicateType_* module constants while giving members fast identity
+    comparison and usability in dict-based dispatch tables.
+    """
+    # One snapshot of the module namespace instead of 38 getattr lookups
+    ext_namespace = vars(_cpp())
+    members = {
+        attr: ext_namespace[constant]
+        for attr, constant in _PREDICATE_TYPE_MEMBERS.items()
+    }
+    predicate_type = enum.IntEnum("PredicateType", members, module=__name__)
+    predicate_type.__doc__ = "Enumeration of predicate types."
+    return predicate_type
 
 __all__ = [
     "__version__",
@@ -520,6 +520,9 @@ class Selector(object):
     def ToString(self):
         return _oeselect.Selector_ToString(self)
 
+    def Hash(self):
+        return _oeselect.Selector_Hash(self)
+
     def __lt__(self, other):
         return _oeselect.Selector___lt__(self, other)
 
@@ -545,7 +548,9 @@ class Selector(object):
         return self.ToString()
 
     def __hash__(self):
-        return hash((self.name, self.residue_number, self.chain, self.insert_code))
+        # Hash() runs in C++ over the raw fields; hashing a tuple here would
+        # materialize four Python strings through SWIG getters per call.
+        return self.Hash()
 
     __swig_destroy__ = _oeselect.delete_Selector
 
@@ -606,18 +611,46 @@ def str_selector_set(mol, selection_str):
 def get_selector_string(atom):
     return _oeselect.get_selector_string(atom)
 
-def EvaluateSelection(mol, selection_str):
-    return _oeselect.EvaluateSelection(mol, selection_str)
+def EvaluateSelection(*args):
+    return _oeselect.EvaluateSelection(*args)
+
+def CountSelection(*args):
+    return _oeselect.CountSelection(*args)
+
+import functools
 
-def CountSelection(mol, selection_str):
-    return _oeselect.CountSelection(mol, selection_str)
 
-def select(mol, selection_str):
+@functools.lru_cache(maxsize=256)
+def parse(selection_str):
+    """Parse a selection string and return an OESelection object.
+
+    Results are memoized per string, so re-running the same selection over
+    many molecules parses it only once; ``parse.cache_clear()`` empties the
+    cache. Invalid selections are not cached and raise on every call.
+
+    :param selection_str: PyMOL-style selection string.
+    :returns: OESelection object that can be used for validation and canonicalization.
+    :raises ValueError: If the selection string is invalid.
+
+    Example::
+
+        sele = parse("name CA and protein")
+        print(sele.ToCanonical())  # Normalized form
+    """
+    return OESelection.Parse(selection_str)
+
+def select(mol, selection_str, _evaluate=EvaluateSelection, _parse=parse):
     """Evaluate a selection string on an OpenEye molecule.
 
+    The trailing defaults bind the helper callables at definition time so
+    each call skips the module-global lookups; they are not part of the
+    public signature.
+
     :param mol: An OpenEye OEMolBase object (OEMol, OEGraphMol, etc.).
     :param selection_str: PyMOL-style selection string (e.g., "name CA", "protein and chain A").
-    :returns: List of atom indices that match the selection.
+    :returns: List-like sequence of atom indices that match the selection,
+        in ascending atom-index order. The indices stay in a C++ vector;
+        call ``list(...)`` if a plain list is required.
 
     Example::
 
@@ -633,9 +666,9 @@ def select(mol, selection_str):
 # Select backbone atoms in chain A
         bb_indices = select(mol, "backbone and chain A")
     """
-    return list(EvaluateSelection(mol, selection_str))
+    return _evaluate(mol, _parse(selection_str))
 
-def count(mol, selection_str):
+def count(mol, selection_str, _count=CountSelection, _parse=parse):
     """Count atoms matching a selection in an OpenEye molecule.
 
     :param mol: An OpenEye OEMolBase object.
@@ -646,21 +679,7 @@ def count(mol, selection_str):
 
         num_carbons = count(mol, "elem C")
     """
-    return CountSelection(mol, selection_str)
-
-def parse(selection_str):
-    """Parse a selection string and return an OESelection object.
-
-    :param selection_str: PyMOL-style selection string.
-    :returns: OESelection object that can be used for validation and canonicalization.
-    :raises ValueError: If the selection string is invalid.
-
-    Example::
-
-        sele = parse("name CA and protein")
-        print(sele.ToCanonical())  # Normalized form
-    """
-    return OESelection.Parse(selection_str)
+    return _count(mol, _parse(selection_str))
 
 def str_selector_set(mol, selection_str):
     """Extract unique residue selector strings for atoms matching a selection.
@@ -18,9 +18,9 @@ struct Context::Impl {
     const OESelection& sele;
     std::unique_ptr<SpatialIndex> spatial_index;
 
-    // Caches keyed by predicate canonical form
-    std::unordered_map<std::string, std::unordered_set<unsigned int>> residue_cache;
-    std::unordered_map<std::string, std::unordered_set<unsigned int>> chain_cache;
+    // Caches keyed by predicate canonical form; all store per-atom masks
+    std::unordered_map<std::string, std::vector<bool>> residue_cache;
+    std::unordered_map<std::string, std::vector<bool>> chain_cache;
     std::unordered_map<std::string, std::vector<bool>> around_cache;
 
     Impl(OEChem::OEMolBase& m, const OESelection& s) : mol(m), sele(s) {}
@@ -43,24 +43,24 @@ SpatialIndex& Context::GetSpatialIndex() {
     return *pimpl_->spatial_index;
 }
 
-const std::unordered_set<unsigned int>& Context::GetResidueAtoms(const std::string& key) {
+const std::vector<bool>& Context::GetResidueMask(const std::string& key) {
     return pimpl_->residue_cache[key];
 }
 
-void Context::SetResidueAtoms(const std::string& key, std::unordered_set<unsigned int> atoms) {
-    pimpl_->residue_cache[key] = std::move(atoms);
+void Context::SetResidueMask(const std::string& key, std::vector<bool> mask) {
+    pimpl_->residue_cache[key] = std::move(mask);
 }
 
 bool Context::HasResidueCache(const std::string& key) const {
     return pimpl_->residue_cache.find(key) != pimpl_->residue_cache.end();
 }
 
-const std::unordered_set<unsigned int>& Context::GetChainAtoms(const std::string& key) {
+const std::vector<bool>& Context::GetChainMask(const std::string& key) {
     return pimpl_->chain_cache[key];
 }
 
-void Context::SetChainAtoms(const std::string& key, std::unordered_set<unsigned int> atoms) {
-    pimpl_->chain_cache[key] = std::move(atoms);
+void Context::SetChainMask(const std::string& key, std::vector<bool> mask) {
+    pimpl_->chain_cache[key] = std::move(mask);
 }
 
 bool Context::HasChainCache(const std::string& key) const {
@@ -7,6 +7,8 @@
 
 #include <algorithm>
 #include <cctype>
+#include <cstddef>
+#include <string_view>
 
 #include <oechem.h>
 
@@ -42,6 +44,41 @@ std::string normalize_name(const std::string& name,
     return result;
 }
 
+/// Trim leading and trailing whitespace from a view (no allocation).
+std::string_view trim_view(const std::string_view sv) {
+    const auto start = sv.find_first_not_of(" \t");
+    if (start == std::string_view::npos) return {};
+    const auto end = sv.find_last_not_of(" \t");
+    return sv.substr(start, end - start + 1);
+}
+
+/**
+ * @brief Compare a candidate name against an already-normalized needle.
+ *
+ * The needle is lowercased/trimmed once at predicate construction, so the
+ * per-atom test only folds the candidate on the fly instead of building a
+ * normalized std::string copy for every atom.
+ */
+bool matches_normalized(const std::string& needle, std::string_view candidate,
+                        const bool case_sensitive, const bool whitespace) {
+    if (!whitespace) {
+        candidate = trim_view(candidate);
+    }
+    if (candidate.size() != needle.size()) {
+        return false;
+    }
+    if (case_sensitive) {
+        return candidate == needle;
+    }
+    for (std::size_t i = 0; i < candidate.size(); ++i) {
+        if (std::tolower(static_cast<unsigned char>(candidate[i])) !=
+            static_cast<unsigned char>(needle[i])) {
+            return false;
+        }
+    }
+    return true;
+}
+
 }  // namespace
 
 namespace OESel {
@@ -66,8 +103,8 @@ OEHasResidueName::~OEHasResidueName() = default;
 
 bool OEHasResidueName::operator()(const OEChem::OEAtomBase& atom) const {
     const OEChem::OEResidue& res = OEChem::OEAtomGetResidue(&atom);
-    const std::string resname = normalize_name(res.GetName(), case_sensitive_, whitespace_);
-    return residue_name_ == resname;
+    const auto raw_name = res.GetName();
+    return matches_normalized(residue_name_, raw_name, case_sensitive_, whitespace_);
 }
 
 OESystem::OEUnaryFunction<OEChem::OEAtomBase, bool>*
@@ -94,8 +131,8 @@ OEHasAtomNameAdvanced::OEHasAtomNameAdvanced(const OEHasAtomNameAdvanced& other)
 OEHasAtomNameAdvanced::~OEHasAtomNameAdvanced() = default;
 
 bool OEHasAtomNameAdvanced::operator()(const OEChem::OEAtomBase& atom) const {
-    const std::string name = normalize_name(atom.GetName(), case_sensitive_, whitespace_);
-    return atom_name_ == name;
+    const auto raw_name = atom.GetName();
+    return matches_normalized(atom_name_, raw_name, case_sensitive_, whitespace_);
 }
 
 OESystem::OEUnaryFunction<OEChem::OEAtomBase, bool>*
@@ -0,0 +1,207 @@
+/**
+ * @file Optimizer.cpp
+ * @brief Predicate-tree optimization implementation.
+ */
+
+#include "oeselect/Optimizer.h"
+#include "oeselect/predicates/LogicalPredicates.h"
+
+#include <algorithm>
+#include <utility>
+#include <vector>
+
+namespace OESel {
+
+namespace {
+
+/// Always-true predicate produced by constant folding
+class AllMatchPredicate : public Predicate {
+public:
+    bool Evaluate(Context&, const OEChem::OEAtomBase&) const override { return true; }
+    [[nodiscard]] std::string ToCanonical() const override { return "all"; }
+    [[nodiscard]] PredicateType Type() const override { return PredicateType::ALL_MATCH; }
+};
+
+/// Always-false predicate produced by constant folding
+class NoMatchPredicate : public Predicate {
+public:
+    bool Evaluate(Context&, const OEChem::OEAtomBase&) const override { return false; }
+    [[nodiscard]] std::string ToCanonical() const override { return "none"; }
+    [[nodiscard]] PredicateType Type() const override { return PredicateType::NO_MATCH; }
+};
+
+/**
+ * @brief Static per-evaluation cost estimate for a leaf predicate type.
+ *
+ * Costs are relative ranks, not measured times. The only property that
+ * matters for ordering is that single property comparisons rank below
+ * string matching, which ranks below tagger-backed component checks,
+ * which rank below expansion and spatial queries.
+ */
+int leaf_cost(const PredicateType type) {
+    switch (type) {
+        case PredicateType::ALL_MATCH:
+        case PredicateType::NO_MATCH:
+            return 0;
+
+        // Single integer/float/character comparison on the atom or residue
+        case PredicateType::INDEX:
+        case PredicateType::ID:
+        case PredicateType::ELEM:
+        case PredicateType::CHAIN:
+        case PredicateType::ALT:
+        case PredicateType::RESI:
+        case PredicateType::FRAGMENT:
+        case PredicateType::B_FACTOR:
+        case PredicateType::HEAVY:
+        case PredicateType::HYDROGEN:
+            return 1;
+
+        // String comparison or glob matching against atom/residue names
+        case PredicateType::NAME:
+        case PredicateType::RESN:
+            return 2;
+
+        // Component and secondary-structure checks read atom generic data
+        // and trigger molecule tagging on first use; polar/nonpolar
+        // hydrogen checks iterate bonds
+        case PredicateType::PROTEIN:
+        case PredicateType::LIGAND:
+        case PredicateType::WATER:
+        case PredicateType::SOLVENT:
+        case PredicateType::ORGANIC:
+        case PredicateType::BACKBONE:
+        case PredicateType::METAL:
+        case PredicateType::CAPPING:
+        case PredicateType::POLAR_HYDROGEN:
+        case PredicateType::NONPOLAR_HYDROGEN:
+        case PredicateType::SECONDARY_STRUCTURE:
+        case PredicateType::HELIX:
+        case PredicateType::SHEET:
+        case PredicateType::TURN:
+        case PredicateType::LOOP:
+            return 4;
+
+        // Expansion operators evaluate their inner selection over the
+        // whole molecule to build residue/chain membership
+        case PredicateType::BY_RES:
+        case PredicateType::BY_CHAIN:
+            return 8;
+
+        // Distance operators build and query a spatial index
+        case PredicateType::AROUND:
+        case PredicateType::EXPAND:
+        case PredicateType::BEYOND:
+            return 10;
+
+        // Composite nodes are costed by their children (see subtree_cost)
+        case PredicateType::AND:
+        case PredicateType::OR:
+        case PredicateType::NOT:
+        case PredicateType::XOR:
+            return 0;
+    }
+    return 4;
+}
+
+/**
+ * @brief Estimated cost of evaluating an entire subtree for one atom.
+ *
+ * Composite nodes sum their children, modelling the worst case where
+ * short-circuiting does not trigger.
+ */
+int subtree_cost(const Predicate& pred) {
+    int cost = leaf_cost(pred.Type());
+    for (const auto& child : pred.Children()) {
+        cost += subtree_cost(*child);
+    }
+    return cost;
+}
+
+/**
+ * @brief Recursively optimize children and return them cheapest-first.
+ */
+std::vector<Predicate::Ptr> optimize_children_sorted(const Predicate& pred) {
+    // Cost each child once up front so the sort comparator does not walk
+    // subtrees on every comparison
+    std::vector<std::pair<int, Predicate::Ptr>> costed;
+    for (const auto& child : pred.Children()) {
+        auto optimized = optimize_predicate(child);
+        costed.emplace_back(subtree_cost(*optimized), std::move(optimized));
+    }
+    // Stable sort keeps the parsed order among equal-cost children
+    std::stable_sort(costed.begin(), costed.end(),
+        [](const auto& a, const auto& b) { return a.first < b.first; });
+
+    std::vector<Predicate::Ptr> children;
+    children.reserve(costed.size());
+    for (auto& entry : costed) {
+        children.push_back(std::move(entry.second));
+    }
+    return children;
+}
+
+}  // namespace
+
+Predicate::Ptr optimize_predicate(const Predicate::Ptr& pred) {
+    switch (pred->Type()) {
+        case PredicateType::AND: {
+            // Constant folding: 'none' dominates AND, 'all' is its identity
+            std::vector<Predicate::Ptr> kept;
+            for (auto& child : optimize_children_sorted(*pred)) {
+                if (child->Type() == PredicateType::NO_MATCH) {
+                    return std::make_shared<NoMatchPredicate>();
+                }
+                if (child->Type() != PredicateType::ALL_MATCH) {
+                    kept.push_back(std::move(child));
+                }
+            }
+            if (kept.empty()) return std::make_shared<AllMatchPredicate>();
+            if (kept.size() == 1) return kept.front();
+            return std::make_shared<AndPredicate>(std::move(kept));
+        }
+        case PredicateType::OR: {
+            // Constant folding: 'all' dominates OR, 'none' is its identity
+            std::vector<Predicate::Ptr> kept;
+            for (auto& child : optimize_children_sorted(*pred)) {
+                if (child->Type() == PredicateType::ALL_MATCH) {
+                    return std::make_shared<AllMatchPredicate>();
+                }
+                if (child->Type() != PredicateType::NO_MATCH) {
+                    kept.push_back(std::move(child));
+                }
+            }
+            if (kept.empty()) return std::make_shared<NoMatchPredicate>();
+            if (kept.size() == 1) return kept.front();
+            return std::make_shared<OrPredicate>(std::move(kept));
+        }
+        case PredicateType::NOT: {
+            auto child = optimize_predicate(pred->Children().front());
+            // Double negation cancels: "not not x" evaluates as x
+            if (child->Type() == PredicateType::NOT) {
+                return child->Children().front();
+            }
+            // Negated constants fold: "not all" is none and vice versa
+            if (child->Type() == PredicateType::ALL_MATCH) {
+                return std::make_shared<NoMatchPredicate>();
+            }
+            if (child->Type() == PredicateType::NO_MATCH) {
+                return std::make_shared<AllMatchPredicate>();
+            }
+            return std::make_shared<NotPredicate>(std::move(child));
+        }
+        case PredicateType::XOR: {
+            // XOR evaluates every child, so ordering does not matter;
+            // still recurse so nested AND/OR chains are optimized
+            std::vector<Predicate::Ptr> children;
+            for (const auto& child : pred->Children()) {
+                children.push_back(optimize_predicate(child));
+            }
+            return std::make_shared<XOrPredicate>(std::move(children));
+        }
+        default:
+            return pred;
+    }
+}
+
+}  // namespace OESel
@@ -34,20 +34,24 @@
 #include <iomanip>
 #include <sstream>
 #include <string>
+#include <string_view>
+#include <unordered_set>
 
 namespace OESel {
 
 namespace {
-std::string trim_ascii_spaces(std::string value) {
+// Trims by adjusting the view bounds; no copy. The view aliases the
+// caller's buffer, so keep the source alive while the result is in use.
+std::string_view trim_ascii_spaces(const std::string_view value) {
     const auto start = value.find_first_not_of(' ');
-    if (start == std::string::npos) {
-        return "";
+    if (start == std::string_view::npos) {
+        return {};
     }
     const auto end = value.find_last_not_of(' ');
     return value.substr(start, end - start + 1);
 }
 
-bool is_backbone_atom_name(const std::string& name) {
+bool is_backbone_atom_name(const std::string_view name) {
     return name == "N" || name == "CA" || name == "C" || name == "O";
 }
 
@@ -56,22 +60,34 @@ void validate_distance_radius(const float radius) {
         throw SelectionError("Distance radius must be non-negative and finite");
     }
 }
+
+// Branchless inclusive range tests: both bound comparisons fold into a
+// single subtract-and-compare via unsigned wraparound. The hi >= lo guard
+// keeps inverted (empty) ranges selecting nothing; it compares constants,
+// so the branch predicts perfectly.
+bool in_range(const int value, const int lo, const int hi) {
+    // Convert before subtracting: signed subtraction can overflow (UB),
+    // while unsigned wraparound is well-defined and gives the same test.
+    return hi >= lo &&
+           static_cast<unsigned int>(value) - static_cast<unsigned int>(lo) <=
+               static_cast<unsigned int>(hi) - static_cast<unsigned int>(lo);
+}
+
+bool in_range(const unsigned int value, const unsigned int lo, const unsigned int hi) {
+    return hi >= lo && value - lo <= hi - lo;
+}
 }  // namespace
 
 // NamePredicate implementation
 
 NamePredicate::NamePredicate(std::string pattern)
     : pattern_(std::move(pattern))
-    , has_wildcard_(pattern_.find('*') != std::string::npos ||
-                    pattern_.find('?') != std::string::npos) {}
+    , match_kind_(classify_glob(pattern_, literal_)) {}
 
 bool NamePredicate::Evaluate(Context&, const OEChem::OEAtomBase& atom) const {
-    std::string name = trim_ascii_spaces(atom.GetName());
-
-    if (has_wildcard_) {
-        return match_glob(pattern_, name);
-    }
-    return name == pattern_;
+    const auto raw_name = atom.GetName();
+    return match_glob_classified(match_kind_, literal_, pattern_,
+                                 trim_ascii_spaces(raw_name));
 }
 
 std::string NamePredicate::ToCanonical() const {
@@ -190,17 +206,12 @@ std::string XOrPredicate::ToCanonical() const {
 
 ResnPredicate::ResnPredicate(std::string pattern)
     : pattern_(std::move(pattern))
-    , has_wildcard_(pattern_.find('*') != std::string::npos ||
-                    pattern_.find('?') != std::string::npos) {}
+    , match_kind_(classify_glob(pattern_, literal_)) {}
 
 bool ResnPredicate::Evaluate(Context&, const OEChem::OEAtomBase& atom) const {
     const OEChem::OEResidue& res = OEChem::OEAtomGetResidue(&atom);
-
-    const std::string resn = res.GetName();
-    if (has_wildcard_) {
-        return match_glob(pattern_, resn);
-    }
-    return resn == pattern_;
+    const auto raw_resn = res.GetName();
+    return match_glob_classified(match_kind_, literal_, pattern_, raw_resn);
 }
 
 std::string ResnPredicate::ToCanonical() const {
@@ -225,7 +236,7 @@ bool ResiPredicate::Evaluate(Context&, const OEChem::OEAtomBase& atom) const {
         case Op::LE:    return resi <= value_;
         case Op::GT:    return resi > value_;
         case Op::GE:    return resi >= value_;
-        case Op::RANGE: return resi >= value_ && resi <= end_value_;
+        case Op::RANGE: return in_range(resi, value_, end_value_);
     }
     return false;  // Should never reach here
 }
@@ -245,13 +256,12 @@ std::string ResiPredicate::ToCanonical() const {
 // ChainPredicate implementation
 
 ChainPredicate::ChainPredicate(std::string chain_id)
-    : chain_id_(std::move(chain_id)) {}
+    : chain_id_(std::move(chain_id))
+    , chain_char_(chain_id_.size() == 1 ? chain_id_[0] : '\0') {}
 
 bool ChainPredicate::Evaluate(Context&, const OEChem::OEAtomBase& atom) const {
     const OEChem::OEResidue& res = OEChem::OEAtomGetResidue(&atom);
-
-    const char chain = res.GetChainID();
-    return chain_id_.size() == 1 && chain == chain_id_[0];
+    return chain_char_ != '\0' && res.GetChainID() == chain_char_;
 }
 
 std::string ChainPredicate::ToCanonical() const {
@@ -301,7 +311,7 @@ bool IndexPredicate::Evaluate(Context&, const OEChem::OEAtomBase& atom) const {
         case Op::LE:    return idx <= value_;
         case Op::GT:    return idx > value_;
         case Op::GE:    return idx >= value_;
-        case Op::RANGE: return idx >= value_ && idx <= end_value_;
+        case Op::RANGE: return in_range(idx, value_, end_value_);
     }
     return false;
 }
@@ -335,7 +345,7 @@ bool IdPredicate::Evaluate(Context&, const OEChem::OEAtomBase& atom) const {
         case Op::LE:    return serial <= value_;
         case Op::GT:    return serial > value_;
         case Op::GE:    return serial >= value_;
-        case Op::RANGE: return serial >= value_ && serial <= end_value_;
+        case Op::RANGE: return in_range(serial, value_, end_value_);
     }
     return false;
 }
@@ -355,12 +365,12 @@ std::string IdPredicate::ToCanonical() const {
 // AltPredicate implementation
 
 AltPredicate::AltPredicate(std::string alt_id)
-    : alt_id_(std::move(alt_id)) {}
+    : alt_id_(std::move(alt_id))
+    , alt_char_(alt_id_.size() == 1 ? alt_id_[0] : '\0') {}
 
 bool AltPredicate::Evaluate(Context&, const OEChem::OEAtomBase& atom) const {
     const OEChem::OEResidue& res = OEChem::OEAtomGetResidue(&atom);
-    const char alt = res.GetAlternateLocation();
-    return alt_id_.size() == 1 && alt == alt_id_[0];
+    return alt_char_ != '\0' && res.GetAlternateLocation() == alt_char_;
 }
 
 std::string AltPredicate::ToCanonical() const {
@@ -435,7 +445,7 @@ bool FragmentPredicate::Evaluate(Context&, const OEChem::OEAtomBase& atom) const
         case Op::LE:    return frag <= value_;
         case Op::GT:    return frag > value_;
         case Op::GE:    return frag >= value_;
-        case Op::RANGE: return frag >= value_ && frag <= end_value_;
+        case Op::RANGE: return in_range(frag, value_, end_value_);
     }
     return false;
 }
@@ -510,7 +520,8 @@ bool BackbonePredicate::Evaluate(Context& ctx, const OEChem::OEAtomBase& atom) c
     Tagger::TagMolecule(ctx.Mol());
     if (!Tagger::HasComponent(atom, ComponentFlag::PROTEIN)) return false;
 
-    return is_backbone_atom_name(trim_ascii_spaces(atom.GetName()));
+    const auto raw_name = atom.GetName();
+    return is_backbone_atom_name(trim_ascii_spaces(raw_name));
 }
 
 // SidechainPredicate implementation - protein atoms that are not backbone
@@ -519,7 +530,8 @@ bool SidechainPredicate::Evaluate(Context& ctx, const OEChem::OEAtomBase& atom)
     Tagger::TagMolecule(ctx.Mol());
     if (!Tagger::HasComponent(atom, ComponentFlag::PROTEIN)) return false;
 
-    const std::string name = trim_ascii_spaces(atom.GetName());
+    const auto raw_name = atom.GetName();
+    const std::string_view name = trim_ascii_spaces(raw_name);
     // Exclude backbone atoms
     if (is_backbone_atom_name(name)) return false;
     // Also exclude OXT (terminal oxygen)
@@ -531,7 +543,8 @@ bool SidechainPredicate::Evaluate(Context& ctx, const OEChem::OEAtomBase& atom)
 
 bool CappingPredicate::Evaluate(Context&, const OEChem::OEAtomBase& atom) const {
     const OEChem::OEResidue& res = OEChem::OEAtomGetResidue(&atom);
-    const std::string resn = res.GetName();
+    const auto raw_resn = res.GetName();
+    const std::string_view resn = raw_resn;
     return resn == "ACE" || resn == "NME";
 }
 
@@ -632,12 +645,7 @@ const std::vector<bool>& get_distance_mask(
 
     for (OESystem::OEIter atom = mol.GetAtoms(); atom; ++atom) {
         if (reference.Evaluate(ctx, *atom)) {
-            const auto nearby = index.FindWithinRadius(*atom, radius);
-            for (const unsigned int idx : nearby) {
-                if (idx < mask.size()) {
-                    mask[idx] = true;
-                }
-            }
+            index.MarkWithinRadius(*atom, radius, mask);
         }
     }
 
@@ -759,12 +767,12 @@ ResidueKey get_residue_key(const OEChem::OEAtomBase& atom) {
 ByResPredicate::ByResPredicate(Ptr child)
     : child_(std::move(child)) {}
 
-const std::unordered_set<unsigned int>& ByResPredicate::GetMatchingResidues(Context& ctx) const {
+const std::vector<bool>& ByResPredicate::GetMatchingResidues(Context& ctx) const {
     const std::string cache_key = "byres_" + child_->ToCanonical();
 
     // Check if already cached
     if (ctx.HasResidueCache(cache_key)) {
-        return ctx.GetResidueAtoms(cache_key);
+        return ctx.GetResidueMask(cache_key);
     }
 
     const OEChem::OEMolBase& mol = ctx.Mol();
@@ -779,22 +787,25 @@ const std::unordered_set<unsigned int>& ByResPredicate::GetMatchingResidues(Cont
         }
     }
 
-    // Second pass: collect all atom indices that belong to matching residues
-    std::unordered_set<unsigned int> matching_atom_indices;
+    // Second pass: mark all atoms that belong to matching residues
+    std::vector mask(mol.NumAtoms(), false);
     for (OESystem::OEIter atom = mol.GetAtoms(); atom; ++atom) {
         if (const auto key = get_residue_key(*atom); matching_residue_keys.count(key) > 0) {
-            matching_atom_indices.insert(atom->GetIdx());
+            const unsigned int idx = atom->GetIdx();
+            if (idx < mask.size()) {
+                mask[idx] = true;
+            }
         }
     }
 
-    ctx.SetResidueAtoms(cache_key, std::move(matching_atom_indices));
-    return ctx.GetResidueAtoms(cache_key);
+    ctx.SetResidueMask(cache_key, std::move(mask));
+    return ctx.GetResidueMask(cache_key);
 }
 
 bool ByResPredicate::Evaluate(Context& ctx, const OEChem::OEAtomBase& atom) const {
-    const auto& matching = GetMatchingResidues(ctx);
+    const auto& mask = GetMatchingResidues(ctx);
     const unsigned int idx = atom.GetIdx();
-    return matching.count(idx) > 0;
+    return idx < mask.size() && mask[idx];
 }
 
 std::string ByResPredicate::ToCanonical() const {
@@ -806,12 +817,12 @@ std::string ByResPredicate::ToCanonical() const {
 ByChainPredicate::ByChainPredicate(Ptr child)
     : child_(std::move(child)) {}
 
-const std::unordered_set<unsigned int>& ByChainPredicate::GetMatchingChainAtoms(Context& ctx) const {
+const std::vector<bool>& ByChainPredicate::GetMatchingChainAtoms(Context& ctx) const {
     const std::string cache_key = "bychain_" + child_->ToCanonical();
 
     // Check if already cached
     if (ctx.HasChainCache(cache_key)) {
-        return ctx.GetChainAtoms(cache_key);
+        return ctx.GetChainMask(cache_key);
     }
 
     const OEChem::OEMolBase& mol = ctx.Mol();
@@ -826,23 +837,26 @@ const std::unordered_set<unsigned int>& ByChainPredicate::GetMatchingChainAtoms(
         }
     }
 
-    // Second pass: collect all atom indices that belong to matching chains
-    std::unordered_set<unsigned int> matching_atom_indices;
+    // Second pass: mark all atoms that belong to matching chains
+    std::vector mask(mol.NumAtoms(), false);
     for (OESystem::OEIter atom = mol.GetAtoms(); atom; ++atom) {
         const OEChem::OEResidue& res = OEChem::OEAtomGetResidue(&*atom);
         if (const auto chain_id = res.GetChainID(); matching_chains.count(chain_id) > 0) {
-            matching_atom_indices.insert(atom->GetIdx());
+            const unsigned int idx = atom->GetIdx();
+            if (idx < mask.size()) {
+                mask[idx] = true;
+            }
         }
     }
 
-    ctx.SetChainAtoms(cache_key, std::move(matching_atom_indices));
-    return ctx.GetChainAtoms(cache_key);
+    ctx.SetChainMask(cache_key, std::move(mask));
+    return ctx.GetChainMask(cache_key);
 }
 
 bool ByChainPredicate::Evaluate(Context& ctx, const OEChem::OEAtomBase& atom) const {
-    const auto& matching = GetMatchingChainAtoms(ctx);
+    const auto& mask = GetMatchingChainAtoms(ctx);
     const unsigned int idx = atom.GetIdx();
-    return matching.count(idx) > 0;
+    return idx < mask.size() && mask[idx];
 }
 
 std::string ByChainPredicate::ToCanonical() const {
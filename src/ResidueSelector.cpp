@@ -8,10 +8,13 @@
 #include "oeselect/Selection.h"
 #include "oeselect/Selector.h"
 
+#include <algorithm>
+#include <cstdint>
 #include <limits>
 #include <regex>
 #include <sstream>
 #include <tuple>
+#include <vector>
 
 #include <oechem.h>
 
@@ -89,6 +92,28 @@ std::string Selector::ToString() const {
            insert_code + ":" + chain;
 }
 
+std::size_t Selector::Hash() const {
+    // FNV-1a over the identifying fields, with separators so that e.g.
+    // ("AB", "C") and ("A", "BC") produce different hashes.
+    std::uint64_t h = 14695981039346656037ULL;
+    const auto mix = [&h](const unsigned char byte) {
+        h ^= byte;
+        h *= 1099511628211ULL;
+    };
+    for (const char c : name) mix(static_cast<unsigned char>(c));
+    mix(':');
+    const auto num = static_cast<std::uint32_t>(residue_number);
+    mix(static_cast<unsigned char>(num));
+    mix(static_cast<unsigned char>(num >> 8));
+    mix(static_cast<unsigned char>(num >> 16));
+    mix(static_cast<unsigned char>(num >> 24));
+    mix(':');
+    for (const char c : chain) mix(static_cast<unsigned char>(c));
+    mix(':');
+    for (const char c : insert_code) mix(static_cast<unsigned char>(c));
+    return static_cast<std::size_t>(h);
+}
+
 bool Selector::operator<(const Selector& other) const {
     return std::tie(chain, residue_number, insert_code, name) <
            std::tie(other.chain, other.residue_number, other.insert_code, other.name);
@@ -167,11 +192,19 @@ std::set<Selector> parse_selector_set(const std::string& selector_str) {
 }
 
 std::set<Selector> mol_to_selector_set(const OEChem::OEMolBase& mol) {
-    std::set<Selector> result;
+    // Collect into a flat vector, then sort + unique before building the
+    // set: per-atom red-black tree inserts are replaced by one sort over
+    // contiguous records, and constructing a std::set from a sorted range
+    // is linear.
+    std::vector<Selector> selectors;
+    selectors.reserve(mol.NumAtoms());
     for (OESystem::OEIter atom = mol.GetAtoms(); atom; ++atom) {
-        result.insert(Selector::FromAtom(*atom));
+        selectors.push_back(Selector::FromAtom(*atom));
     }
-    return result;
+    std::sort(selectors.begin(), selectors.end());
+    selectors.erase(std::unique(selectors.begin(), selectors.end()),
+                    selectors.end());
+    return {selectors.begin(), selectors.end()};
 }
 
 std::set<Selector> selector_set(
@@ -4,9 +4,10 @@
  */
 
 #include "oeselect/Selection.h"
+#include "oeselect/Optimizer.h"
 #include "oeselect/Parser.h"
 
-#include <algorithm>
+#include <cstdint>
 
 namespace OESel {
 
@@ -25,19 +26,52 @@ public:
     [[nodiscard]] PredicateType Type() const override { return PredicateType::ALL_MATCH; }
 };
 
+namespace {
+
+// Every PredicateType must fit into the 64-bit type mask below.
+static_assert(static_cast<unsigned>(PredicateType::NO_MATCH) < 64,
+              "PredicateType no longer fits in a uint64_t mask");
+
+/**
+ * @brief Collect the set of predicate types present in a subtree.
+ *
+ * @param pred Root of subtree to walk.
+ * @return Bitmask with bit (1 << type) set for each type in the subtree.
+ */
+uint64_t collect_type_mask(const Predicate& pred) {
+    uint64_t mask = 1ULL << static_cast<unsigned>(pred.Type());
+    for (const auto& child : pred.Children()) {
+        mask |= collect_type_mask(*child);
+    }
+    return mask;
+}
+
+}  // namespace
+
 /// PIMPL implementation holding the root predicate
 struct OESelection::Impl {
     Predicate::Ptr root;
-
-    Impl() : root(std::make_shared<TruePredicate>()) {}
-    explicit Impl(Predicate::Ptr r) : root(std::move(r)) {}
+    std::string canonical;  ///< Cached result of root->ToCanonical()
+    uint64_t type_mask;     ///< Bit per PredicateType present in the tree
+
+    // The predicate tree is immutable once constructed, so the canonical
+    // form and the predicate-type mask can be computed eagerly instead of
+    // re-walking the tree on every ToCanonical()/ContainsPredicate() call.
+    Impl()
+        : root(std::make_shared<TruePredicate>()),
+          canonical(root->ToCanonical()),
+          type_mask(collect_type_mask(*root)) {}
+    explicit Impl(Predicate::Ptr r)
+        : root(std::move(r)),
+          canonical(root->ToCanonical()),
+          type_mask(collect_type_mask(*root)) {}
 };
 
 OESelection OESelection::Parse(const std::string& sele) {
     if (sele.empty()) {
         return {};  // Empty string = select all
     }
-    const auto root = parse_selection(sele);
+    const auto root = optimize_predicate(parse_selection(sele));
     return OESelection(root);
 }
 
@@ -63,29 +97,11 @@ OESelection& OESelection::operator=(OESelection&& other) noexcept = default;
 OESelection::~OESelection() = default;
 
 std::string OESelection::ToCanonical() const {
-    return pimpl_->root->ToCanonical();
-}
-
-namespace {
-/**
- * @brief Recursively search predicate tree for a specific type.
- *
- * @param pred Root of subtree to search.
- * @param type Target predicate type.
- * @return true if any predicate in the subtree has the target type.
- */
-bool contains_predicate_recursive(const Predicate& pred, const PredicateType type) {
-    if (pred.Type() == type) {
-        return true;
-    }
-    const auto& children = pred.Children();
-    return std::any_of(children.begin(), children.end(),
-        [type](const auto& child) { return contains_predicate_recursive(*child, type); });
+    return pimpl_->canonical;
 }
-}  // namespace
 
 bool OESelection::ContainsPredicate(const PredicateType type) const {
-    return contains_predicate_recursive(*pimpl_->root, type);
+    return (pimpl_->type_mask >> static_cast<unsigned>(type)) & 1ULL;
 }
 
 const Predicate& OESelection::Root() const {
@@ -91,7 +91,10 @@ std::vector<unsigned int> SpatialIndex::FindWithinRadius(
     const float radius_sq = radius * radius;  // nanoflann uses squared distances
 
     std::vector<nanoflann::ResultItem<unsigned int, float>> matches;
-    pimpl_->tree->radiusSearch(query, radius_sq, matches);
+    // Callers only test membership, so skip nanoflann's sort-by-distance
+    nanoflann::SearchParameters params;
+    params.sorted = false;
+    pimpl_->tree->radiusSearch(query, radius_sq, matches, params);
 
     result.reserve(matches.size());
     for (const auto& match : matches) {
@@ -107,6 +110,27 @@ std::vector<unsigned int> SpatialIndex::FindWithinRadius(const OEChem::OEAtomBas
     return FindWithinRadius(xyz[0], xyz[1], xyz[2], radius);
 }
 
+void SpatialIndex::MarkWithinRadius(const OEChem::OEAtomBase& atom, const float radius,
+                                    std::vector<bool>& mask) const {
+    if (!pimpl_->tree) return;
+
+    float xyz[3];
+    atom.GetParent()->GetCoords(&atom, xyz);
+    const float radius_sq = radius * radius;  // nanoflann uses squared distances
+
+    std::vector<nanoflann::ResultItem<unsigned int, float>> matches;
+    nanoflann::SearchParameters params;
+    params.sorted = false;
+    pimpl_->tree->radiusSearch(xyz, radius_sq, matches, params);
+
+    for (const auto& match : matches) {
+        const unsigned int idx = pimpl_->cloud.atom_indices[match.first];
+        if (idx < mask.size()) {
+            mask[idx] = true;
+        }
+    }
+}
+
 size_t SpatialIndex::Size() const {
     return pimpl_->cloud.atom_indices.size();
 }
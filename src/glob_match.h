@@ -14,7 +14,10 @@
 #ifndef OESELECT_GLOB_MATCH_H
 #define OESELECT_GLOB_MATCH_H
 
+#include "oeselect/Predicate.h"
+
 #include <string>
+#include <string_view>
 
 namespace OESel {
 
@@ -22,10 +25,10 @@ namespace OESel {
  * @brief Match a string against a wildcard pattern.
  *
  * :param pattern: Pattern containing literal chars plus `*` and `?`.
- * :param text: String to test.
+ * :param text: String to test (viewed, not copied).
  * :returns: ``true`` if the pattern matches the entire text.
  */
-inline bool match_glob(const std::string& pattern, const std::string& text) {
+inline bool match_glob(const std::string& pattern, const std::string_view text) {
     const size_t np = pattern.size();
     const size_t nt = text.size();
     size_t pi = 0;
@@ -53,6 +56,68 @@ inline bool match_glob(const std::string& pattern, const std::string& text) {
     return pi == np;
 }
 
+/**
+ * @brief Classify a wildcard pattern and extract its literal part.
+ *
+ * Performed once at predicate construction so that Evaluate() avoids the
+ * general backtracking matcher for the overwhelmingly common pattern shapes.
+ *
+ * :param pattern: Pattern containing literal chars plus `*` and `?`.
+ * :param literal: Receives the pattern with the anchoring `*` removed for
+ *     EXACT/PREFIX/SUFFIX kinds; left empty for GLOB.
+ * :returns: The :cpp:enum:`GlobMatchKind` of the pattern.
+ */
+inline GlobMatchKind classify_glob(const std::string& pattern, std::string& literal) {
+    const bool has_qmark = pattern.find('?') != std::string::npos;
+    const size_t first_star = pattern.find('*');
+
+    if (!has_qmark && first_star == std::string::npos) {
+        literal = pattern;
+        return GlobMatchKind::EXACT;
+    }
+    // first_star == size-1 implies it is also the only '*'
+    if (!has_qmark && first_star == pattern.size() - 1) {
+        literal = pattern.substr(0, first_star);
+        return GlobMatchKind::PREFIX;
+    }
+    if (!has_qmark && first_star == 0 &&
+        pattern.find('*', 1) == std::string::npos) {
+        literal = pattern.substr(1);
+        return GlobMatchKind::SUFFIX;
+    }
+    literal.clear();
+    return GlobMatchKind::GLOB;
+}
+
+/**
+ * @brief Match text against a pattern pre-classified by classify_glob().
+ *
+ * :param kind: Classification returned by :cpp:func:`classify_glob`.
+ * :param literal: Literal part extracted by :cpp:func:`classify_glob`.
+ * :param pattern: Original pattern (used only for the GLOB fallback).
+ * :param text: String to test (viewed, not copied).
+ * :returns: ``true`` if the pattern matches the entire text.
+ */
+inline bool match_glob_classified(const GlobMatchKind kind,
+                                  const std::string& literal,
+                                  const std::string& pattern,
+                                  const std::string_view text) {
+    switch (kind) {
+        case GlobMatchKind::EXACT:
+            return text == literal;
+        case GlobMatchKind::PREFIX:
+            return text.size() >= literal.size() &&
+                   text.compare(0, literal.size(), literal) == 0;
+        case GlobMatchKind::SUFFIX:
+            return text.size() >= literal.size() &&
+                   text.compare(text.size() - literal.size(),
+                                literal.size(), literal) == 0;
+        case GlobMatchKind::GLOB:
+            return match_glob(pattern, text);
+    }
+    return false;
+}
+
 }  // namespace OESel
 
 #endif  // OESELECT_GLOB_MATCH_H
@@ -205,15 +205,29 @@ static PyObject* _oeselect_wrap_as_oe_grid(OESystem::OEScalarGrid* grid) {
     return oe_grid;
 }
 
-// Helper function to evaluate selection and return matching atom indices
+// Helper function to evaluate a pre-parsed selection and return matching
+// atom indices (used by the cached-parse fast path on the Python side)
 std::vector<unsigned int> EvaluateSelection(
     OEChem::OEMolBase& mol,
-    const std::string& selection_str
+    const OESel::OESelection& sele
 ) {
-    OESel::OESelection sele = OESel::OESelection::Parse(selection_str);
-    OESel::OESelect selector(mol, sele);
+    // 'all' and 'none' are known from the optimized root predicate type;
+    // skip predicate evaluation (and OESelect construction) for them.
+    const OESel::PredicateType root_type = sele.Root().Type();
+    if (root_type == OESel::PredicateType::NO_MATCH) {
+        return {};
+    }
 
     std::vector<unsigned int> result;
+    result.reserve(mol.NumAtoms());
+    if (root_type == OESel::PredicateType::ALL_MATCH) {
+        for (OESystem::OEIter<OEChem::OEAtomBase> atom = mol.GetAtoms(); atom; ++atom) {
+            result.push_back(atom->GetIdx());
+        }
+        return result;
+    }
+
+    OESel::OESelect selector(mol, sele);
     for (OESystem::OEIter<OEChem::OEAtomBase> atom = mol.GetAtoms(); atom; ++atom) {
         if (selector(*atom)) {
             result.push_back(atom->GetIdx());
@@ -222,12 +236,29 @@ std::vector<unsigned int> EvaluateSelection(
     return result;
 }
 
-// Helper function to count atoms matching a selection
-unsigned int CountSelection(
+// Helper function to evaluate selection and return matching atom indices
+std::vector<unsigned int> EvaluateSelection(
     OEChem::OEMolBase& mol,
     const std::string& selection_str
 ) {
-    OESel::OESelection sele = OESel::OESelection::Parse(selection_str);
+    return EvaluateSelection(mol, OESel::OESelection::Parse(selection_str));
+}
+
+// Helper function to count atoms matching a pre-parsed selection
+unsigned int CountSelection(
+    OEChem::OEMolBase& mol,
+    const OESel::OESelection& sele
+) {
+    // Same fast paths as EvaluateSelection: no atom loop needed when the
+    // optimized root is a constant predicate.
+    const OESel::PredicateType root_type = sele.Root().Type();
+    if (root_type == OESel::PredicateType::NO_MATCH) {
+        return 0;
+    }
+    if (root_type == OESel::PredicateType::ALL_MATCH) {
+        return mol.NumAtoms();
+    }
+
     OESel::OESelect selector(mol, sele);
 
     unsigned int count = 0;
@@ -238,6 +269,14 @@ unsigned int CountSelection(
     }
     return count;
 }
+
+// Helper function to count atoms matching a selection
+unsigned int CountSelection(
+    OEChem::OEMolBase& mol,
+    const std::string& selection_str
+) {
+    return CountSelection(mol, OESel::OESelection::Parse(selection_str));
+}
 %}
 
 // ============================================================================
@@ -504,6 +543,7 @@ struct Selector {
     static Selector FromAtom(const OEChem::OEAtomBase& atom);
     static Selector FromString(const std::string& selector_str);
     std::string ToString() const;
+    size_t Hash() const;
 
     bool operator<(const Selector& other) const;
     bool operator>(const Selector& other) const;
@@ -567,11 +607,21 @@ std::string get_selector_string(const OEChem::OEAtomBase& atom);
 // ============================================================================
 // Bulk helper functions (outside namespace for simpler Python access)
 // ============================================================================
+std::vector<unsigned int> EvaluateSelection(
+    OEChem::OEMolBase& mol,
+    const OESel::OESelection& sele
+);
+
 std::vector<unsigned int> EvaluateSelection(
     OEChem::OEMolBase& mol,
     const std::string& selection_str
 );
 
+unsigned int CountSelection(
+    OEChem::OEMolBase& mol,
+    const OESel::OESelection& sele
+);
+
 unsigned int CountSelection(
     OEChem::OEMolBase& mol,
     const std::string& selection_str
@@ -612,7 +662,9 @@ def __str__(self):
     return self.ToString()
 
 def __hash__(self):
-    return hash((self.name, self.residue_number, self.chain, self.insert_code))
+    # Hash() runs in C++ over the raw fields; hashing a tuple here would
+    # materialize four Python strings through SWIG getters per call.
+    return self.Hash()
 %}
 }
 
@@ -620,12 +672,40 @@ def __hash__(self):
 // Module-level Python code
 // ============================================================================
 %pythoncode %{
-def select(mol, selection_str):
+import functools
+
+
+@functools.lru_cache(maxsize=256)
+def parse(selection_str):
+    """Parse a selection string and return an OESelection object.
+
+    Results are memoized per string, so re-running the same selection over
+    many molecules parses it only once; ``parse.cache_clear()`` empties the
+    cache. Invalid selections are not cached and raise on every call.
+
+    :param selection_str: PyMOL-style selection string.
+    :returns: OESelection object that can be used for validation and canonicalization.
+    :raises ValueError: If the selection string is invalid.
+
+    Example::
+
+        sele = parse("name CA and protein")
+        print(sele.ToCanonical())  # Normalized form
+    """
+    return OESelection.Parse(selection_str)
+
+def select(mol, selection_str, _evaluate=EvaluateSelection, _parse=parse):
     """Evaluate a selection string on an OpenEye molecule.
 
+    The trailing defaults bind the helper callables at definition time so
+    each call skips the module-global lookups; they are not part of the
+    public signature.
+
     :param mol: An OpenEye OEMolBase object (OEMol, OEGraphMol, etc.).
     :param selection_str: PyMOL-style selection string (e.g., "name CA", "protein and chain A").
-    :returns: List of atom indices that match the selection.
+    :returns: List-like sequence of atom indices that match the selection,
+        in ascending atom-index order. The indices stay in a C++ vector;
+        call ``list(...)`` if a plain list is required.
 
     Example::
 
@@ -641,9 +721,9 @@ def select(mol, selection_str):
         # Select backbone atoms in chain A
         bb_indices = select(mol, "backbone and chain A")
     """
-    return list(EvaluateSelection(mol, selection_str))
+    return _evaluate(mol, _parse(selection_str))
 
-def count(mol, selection_str):
+def count(mol, selection_str, _count=CountSelection, _parse=parse):
     """Count atoms matching a selection in an OpenEye molecule.
 
     :param mol: An OpenEye OEMolBase object.
@@ -654,21 +734,7 @@ def count(mol, selection_str):
 
         num_carbons = count(mol, "elem C")
     """
-    return CountSelection(mol, selection_str)
-
-def parse(selection_str):
-    """Parse a selection string and return an OESelection object.
-
-    :param selection_str: PyMOL-style selection string.
-    :returns: OESelection object that can be used for validation and canonicalization.
-    :raises ValueError: If the selection string is invalid.
-
-    Example::
-
-        sele = parse("name CA and protein")
-        print(sele.ToCanonical())  # Normalized form
-    """
-    return OESelection.Parse(selection_str)
+    return _count(mol, _parse(selection_str))
 
 def str_selector_set(mol, selection_str):
     """Extract unique residue selector strings for atoms matching a selection.
@@ -2,7 +2,7 @@
 Invoke tasks for OESelect project management
 """
 
-import os
+import subprocess
 import sys
 from pathlib import Path
 
@@ -14,6 +14,10 @@ DOCS_DIR = PROJECT_ROOT / "docs"
 BUILD_DIR = DOCS_DIR / "_build"
 HTML_DIR = BUILD_DIR / "html"
 
+# Commands run through subprocess with an explicit cwd rather than invoke's
+# ctx.run: none of them need shell features, so this skips the intermediate
+# shell process and avoids mutating the process working directory.
+
 
 @task
 def docs(ctx, clean=False):
@@ -21,16 +25,14 @@ def docs(ctx, clean=False):
 
     :param clean: Remove build directory first.
     """
-    os.chdir(DOCS_DIR)
-
     if clean:
         print("Cleaning build directory...")
-        ctx.run("make clean", warn=True)
+        subprocess.run(["make", "clean"], cwd=DOCS_DIR, check=False)
 
     print("Building documentation...")
-    result = ctx.run("make html", warn=True)
+    result = subprocess.run(["make", "html"], cwd=DOCS_DIR, check=False)
 
-    if result.ok:
+    if result.returncode == 0:
         print(f"\nDocumentation built successfully!")
         print(f"Open: file://{HTML_DIR}/index.html")
     else:
@@ -47,22 +49,24 @@ def serve_docs(ctx, port=8000, clean=False, watch=False):
     :param watch: Auto-rebuild and reload on source changes.
     """
     if clean:
-        os.chdir(DOCS_DIR)
         print("Cleaning build directory...")
-        ctx.run("make clean", warn=True)
+        subprocess.run(["make", "clean"], cwd=DOCS_DIR, check=False)
 
     if watch:
         print(f"\nWatching for changes and serving at http://localhost:{port}")
         print("Press Ctrl+C to stop.\n")
-        os.chdir(DOCS_DIR)
-        ctx.run(
-            f"{sys.executable} -m sphinx_autobuild"
-            f" . {HTML_DIR}"
-            f" --port {port}"
-            f" --open-browser"
-            f" --re-ignore '/_doxygen/'"
-            f" --re-ignore '/cpp-api/'"
-            f" --re-ignore '/_build/'"
+        subprocess.run(
+            [
+                sys.executable, "-m", "sphinx_autobuild",
+                ".", str(HTML_DIR),
+                "--port", str(port),
+                "--open-browser",
+                "--re-ignore", "/_doxygen/",
+                "--re-ignore", "/cpp-api/",
+                "--re-ignore", "/_build/",
+            ],
+            cwd=DOCS_DIR,
+            check=False,
         )
     else:
         docs(ctx, clean=False)
@@ -70,19 +74,20 @@ def serve_docs(ctx, port=8000, clean=False, watch=False):
         print(f"\nServing documentation at http://localhost:{port}")
         print("Press Ctrl+C to stop.\n")
 
-        os.chdir(HTML_DIR)
-        ctx.run(f"{sys.executable} -m http.server {port}")
+        subprocess.run(
+            [sys.executable, "-m", "http.server", str(port)],
+            cwd=HTML_DIR,
+            check=False,
+        )
 
 
 @task
 def docs_check(ctx):
     """Build documentation with warnings as errors (for CI)."""
-    os.chdir(DOCS_DIR)
-
     print("Building documentation with strict checking...")
-    result = ctx.run("make check", warn=True)
+    result = subprocess.run(["make", "check"], cwd=DOCS_DIR, check=False)
 
-    if result.ok:
+    if result.returncode == 0:
         print("\nDocumentation check passed!")
     else:
         print("\nDocumentation check failed - fix warnings.", file=sys.stderr)
@@ -93,5 +98,15 @@ def docs_check(ctx):
 def docs_deps(ctx):
     """Install documentation dependencies."""
     print("Installing documentation dependencies...")
-    ctx.run(f"{sys.executable} -m pip install -r {DOCS_DIR}/requirements.txt")
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "pip", "install",
+            "-r", str(DOCS_DIR / "requirements.txt"),
+        ],
+        check=False,
+    )
+
+    if result.returncode != 0:
+        print("\nDependency installation failed.", file=sys.stderr)
+        sys.exit(1)
     print("Done!")
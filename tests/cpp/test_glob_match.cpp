@@ -5,7 +5,10 @@
 
 #include "glob_match.h"
 
+using OESel::classify_glob;
+using OESel::GlobMatchKind;
 using OESel::match_glob;
+using OESel::match_glob_classified;
 
 TEST(GlobMatch, ExactStringMatches) {
     EXPECT_TRUE(match_glob("CA", "CA"));
@@ -59,3 +62,34 @@ TEST(GlobMatch, BiologicalAtomNames) {
     EXPECT_TRUE(match_glob("HD?", "HD2"));
     EXPECT_FALSE(match_glob("HD?", "HE1"));
 }
+
+TEST(GlobClassify, PatternShapes) {
+    std::string literal;
+    EXPECT_EQ(classify_glob("CA", literal), GlobMatchKind::EXACT);
+    EXPECT_EQ(literal, "CA");
+    EXPECT_EQ(classify_glob("CA*", literal), GlobMatchKind::PREFIX);
+    EXPECT_EQ(literal, "CA");
+    EXPECT_EQ(classify_glob("*G", literal), GlobMatchKind::SUFFIX);
+    EXPECT_EQ(literal, "G");
+    // Bare '*' is a degenerate prefix with an empty literal
+    EXPECT_EQ(classify_glob("*", literal), GlobMatchKind::PREFIX);
+    EXPECT_EQ(literal, "");
+    // Anything with '?' or interior/multiple '*' needs the full matcher
+    EXPECT_EQ(classify_glob("HD?", literal), GlobMatchKind::GLOB);
+    EXPECT_EQ(classify_glob("C*A", literal), GlobMatchKind::GLOB);
+    EXPECT_EQ(classify_glob("*CA*", literal), GlobMatchKind::GLOB);
+}
+
+TEST(GlobClassify, ClassifiedMatchAgreesWithMatchGlob) {
+    const char* patterns[] = {"CA", "CA*", "*G", "*", "HD?", "C*A", "*CA*", ""};
+    const char* texts[] = {"", "C", "CA", "CB", "CAB", "XCA", "HD1", "ChainA", "G", "OG"};
+    for (const char* pattern : patterns) {
+        std::string literal;
+        const GlobMatchKind kind = classify_glob(pattern, literal);
+        for (const char* text : texts) {
+            EXPECT_EQ(match_glob_classified(kind, literal, pattern, text),
+                      match_glob(pattern, text))
+                << "pattern=" << pattern << " text=" << text;
+        }
+    }
+}
@@ -3117,3 +3117,29 @@ TEST(TaggerTest, MethionineStillClassifiedAsProtein) {
         EXPECT_TRUE(Tagger::HasComponent(*atom, ComponentFlag::PROTEIN));
     }
 }
+
+// ============================================================================
+// Optimizer constant-folding tests
+// ============================================================================
+
+TEST(OptimizerTest, NoneDominatesAnd) {
+    EXPECT_EQ(OESelection::Parse("name CA and none").ToCanonical(), "none");
+}
+
+TEST(OptimizerTest, AllDominatesOr) {
+    EXPECT_EQ(OESelection::Parse("name CA or all").ToCanonical(), "all");
+}
+
+TEST(OptimizerTest, IdentityConstantsAreDropped) {
+    EXPECT_EQ(OESelection::Parse("all and name CA").ToCanonical(), "name CA");
+    EXPECT_EQ(OESelection::Parse("none or name CA").ToCanonical(), "name CA");
+}
+
+TEST(OptimizerTest, NegatedConstantsInvert) {
+    EXPECT_EQ(OESelection::Parse("not all").ToCanonical(), "none");
+    EXPECT_EQ(OESelection::Parse("not none").ToCanonical(), "all");
+}
+
+TEST(OptimizerTest, DoubleNegationCancels) {
+    EXPECT_EQ(OESelection::Parse("not not name CA").ToCanonical(), "name CA");
+}
@@ -227,6 +227,36 @@ TEST_F(SpatialIndexTest, ZeroRadius) {
     EXPECT_EQ(tiny.size(), 1);
 }
 
+TEST_F(SpatialIndexTest, MarkWithinRadius) {
+    // Mask-filling variant should agree with FindWithinRadius and
+    // accumulate (OR) across multiple reference atoms
+    OEChem::OEAtomBase* a1 = mol_->NewAtom(6);
+    OEChem::OEAtomBase* a2 = mol_->NewAtom(6);
+    OEChem::OEAtomBase* a3 = mol_->NewAtom(6);
+
+    float coords1[3] = {0.0f, 0.0f, 0.0f};
+    float coords2[3] = {1.5f, 0.0f, 0.0f};
+    float coords3[3] = {5.0f, 0.0f, 0.0f};
+
+    mol_->SetCoords(a1, coords1);
+    mol_->SetCoords(a2, coords2);
+    mol_->SetCoords(a3, coords3);
+
+    SpatialIndex index(*mol_);
+
+    std::vector<bool> mask(mol_->NumAtoms(), false);
+    index.MarkWithinRadius(*a1, 2.0f, mask);
+    EXPECT_TRUE(mask[a1->GetIdx()]);
+    EXPECT_TRUE(mask[a2->GetIdx()]);
+    EXPECT_FALSE(mask[a3->GetIdx()]);
+
+    // Second query unions into the same mask
+    index.MarkWithinRadius(*a3, 1.0f, mask);
+    EXPECT_TRUE(mask[a1->GetIdx()]);
+    EXPECT_TRUE(mask[a2->GetIdx()]);
+    EXPECT_TRUE(mask[a3->GetIdx()]);
+}
+
 TEST_F(SpatialIndexTest, ReturnsCorrectAtomIndices) {
     // Verify that returned indices match atom indices
     std::vector<unsigned int> expected_indices;
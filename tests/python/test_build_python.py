@@ -1,7 +1,6 @@
 """Build script behavior tests."""
 
 import importlib.util
-import platform
 import subprocess
 from pathlib import Path
 
@@ -50,14 +49,15 @@ def test_build_wheel_passes_separate_openeye_link_and_runtime_dirs(
     dist_dir = tmp_path / "dist"
     captured_commands = []
 
-    def fake_run_command(cmd, cwd=None, check=True, capture_output=False, verbose=False):
+    def fake_run_command(cmd, cwd=None, check=True, capture_output=False, verbose=False,
+                         env=None, close_fds=True):
         captured_commands.append(cmd)
         dist_dir.mkdir(exist_ok=True)
         (dist_dir / "oeselect-1.3.5-py3-none-any.whl").write_text("wheel")
         return subprocess.CompletedProcess(cmd, 0, "", "")
 
     monkeypatch.setattr(build_python, "run_command", fake_run_command)
-    monkeypatch.setattr(platform, "system", lambda: "Linux")
+    monkeypatch.setattr(build_python, "_IS_DARWIN", False)
 
     wheel = build_python.build_wheel(
         tmp_path,